@@ -5,7 +5,13 @@ import sys
 import os
 import shutil
 import json
+import mmap
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from itertools import islice
+from pathlib import Path
 from typing import List, Optional
 
 # Try to import rich for pretty printing
@@ -19,9 +25,113 @@ except ImportError:
     print("Please run: pip install -r requirements.txt")
     sys.exit(1)
 
+# orjson is optional; fall back to the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # --- Configuration ---
 REQUIRED_TOOLS = ["subfinder", "dnsx", "naabu", "httpx", "katana"]
 DEFAULT_PORTS = "80,443,8080,8443,8000,8008,8888"
+LLM_URL_LIMIT = 200
+MAX_SHARDS = 8
+
+# Output artifacts, keyed by their name in summary.json where applicable
+FILE_MAP = {
+    "subdomains": "subfinder.txt",
+    "resolved": "dnsx.txt",
+    "ports": "naabu.txt",
+    "http_services": "httpx.txt",
+    "katana_input": "katana_input_clean.txt",
+    "endpoints": "katana.txt",
+    "burp_import": "urls_for_burp.txt",
+    "summary": "summary.json",
+    "llm_prompt": "llm_prompt.txt",
+}
+SUMMARY_STATS = ["subdomains", "resolved", "ports", "http_services", "endpoints", "burp_import"]
+
+# Burp URL normalisation: first field of each line, CR stripped, http(s) only (see _burp_url)
+BURP_URL_AWK = '{ sub(/\\r+$/, "") } $1 ~ /^http/ { print $1 }'
+
+# Go install locations take priority over the regular PATH; resolved once at import
+try:
+    _GOBIN = subprocess.run(["go", "env", "GOBIN"], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, timeout=5).stdout.strip()
+except (OSError, subprocess.TimeoutExpired):
+    _GOBIN = ""
+AUGMENTED_PATH = os.pathsep.join(p for p in [_GOBIN, os.path.expanduser("~/go/bin"), "/usr/local/bin", "/usr/bin", os.environ.get("PATH", "")] if p)
+
+# Spawned tools inherit the full environment (CA bundles, proxies, provider keys), with Go paths first
+TOOL_ENV = {**os.environ, "PATH": AUGMENTED_PATH}
+
+def _count_lines(path):
+    """Counts lines by scanning 1 MiB chunks for newlines, without building a line list."""
+    count = 0
+    last = b"\n"
+    with open(path, 'rb') as f:
+        for buf in iter(lambda: f.read(1 << 20), b''):
+            count += buf.count(b'\n')
+            last = buf
+    # A trailing line without a newline still counts, matching readlines()
+    if not last.endswith(b"\n"): count += 1
+    return count
+
+def _json_bytes(obj):
+    """Serializes obj as 2-space indented JSON bytes, using orjson when available."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+def _validate_httpx(path):
+    """Returns True if path is the ProjectDiscovery httpx (the Python library ships a CLI of the same name)."""
+    try:
+        subprocess.run([path, "-version"], capture_output=True, check=True, env=TOOL_ENV)
+        return True
+    except (OSError, subprocess.CalledProcessError):
+        return False
+
+def _extract_first_field(src, dest):
+    """
+    Writes the first field of each non-blank line in src to dest (httpx line -> bare URL).
+    Fields are whitespace-separated, as in awk, so both paths below produce the same output.
+    """
+    with open(dest, 'wb') as out:
+        try:
+            subprocess.run(["awk", "NF {print $1}", src], stdout=out, check=True, env=TOOL_ENV)
+            return
+        except (OSError, subprocess.CalledProcessError):
+            out.seek(0); out.truncate()
+
+        # Fallback without awk: walk a read-only mapping of the file
+        if os.path.getsize(src) == 0: return
+        with open(src, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line in iter(mm.readline, b''):
+                fields = line.split(None, 1)
+                if fields: out.write(fields[0] + b'\n')
+
+def _append_file(src_path, dst):
+    """
+    Appends src_path to the open binary file dst, using zero-copy sendfile where supported.
+    Bytes are passed through unvalidated; callers normalise the combined output afterwards.
+    """
+    with open(src_path, 'rb') as src:
+        size = os.fstat(src.fileno()).st_size
+        offset = 0
+        dst.flush()
+        try:
+            while offset < size:
+                sent = os.sendfile(dst.fileno(), src.fileno(), offset, size - offset)
+                if sent == 0: break
+                offset += sent
+        except (AttributeError, OSError):
+            # No sendfile, or no file-to-file support (e.g. macOS): copy the rest in userspace
+            src.seek(offset)
+            shutil.copyfileobj(src, dst, 1 << 20)
+
+def _burp_url(line):
+    """Python twin of BURP_URL_AWK: returns the URL on a raw line, or None for blank/non-http lines."""
+    fields = line.split(None, 1)
+    return fields[0] if fields and fields[0].startswith(b"http") else None
 
 class ReconPipeline:
     def __init__(self, args):
@@ -31,6 +141,8 @@ class ReconPipeline:
         self.proxy = args.proxy
         self.dry_run = args.dry_run
         self.llm_analysis = args.llm
+        self._bins = {}
+        self.paths = {key: Path(self.output_dir) / filename for key, filename in FILE_MAP.items()}
         
         if not self.dry_run:
             os.makedirs(self.output_dir, exist_ok=True)
@@ -40,85 +152,60 @@ class ReconPipeline:
 
     def get_binary_path(self, tool_name):
         """Locates the tool binary, prioritizing Go paths."""
-        possible_paths = [
-            os.path.expanduser(f"~/go/bin/{tool_name}"),
-            f"/usr/local/bin/{tool_name}",
-            f"/usr/bin/{tool_name}"
-        ]
-        # Check GOBIN
-        try:
-            gobin = subprocess.check_output(["go", "env", "GOBIN"], text=True, stderr=subprocess.DEVNULL).strip()
-            if gobin:
-                possible_paths.insert(0, os.path.join(gobin, tool_name))
-        except:
-            pass
-
-        for p in possible_paths:
-            if os.path.exists(p):
-                # Special check for httpx to avoid python library conflict
-                if tool_name == "httpx":
-                    try:
-                        subprocess.run([p, "-version"], capture_output=True, check=True)
-                        return p
-                    except:
-                        continue
-                return p
-        
-        return shutil.which(tool_name) or tool_name
+        return shutil.which(tool_name, path=AUGMENTED_PATH) or tool_name
 
     def check_tools(self):
         """Verifies tools are installed."""
         self.log("Checking for required tools...", style="cyan")
-        missing = []
-        for tool in REQUIRED_TOOLS:
-            path = self.get_binary_path(tool)
-            if path == tool and not shutil.which(tool):
-                missing.append(tool)
-            elif path != tool and not os.path.exists(path):
-                missing.append(tool)
-        
+        with ThreadPoolExecutor(max_workers=len(REQUIRED_TOOLS)) as executor:
+            self._bins = dict(zip(REQUIRED_TOOLS, executor.map(self.get_binary_path, REQUIRED_TOOLS)))
+
+        # Special check for httpx to avoid python library conflict
+        rejected = self._bins["httpx"]
+        if rejected != "httpx" and not _validate_httpx(rejected):
+            candidates = (shutil.which("httpx", path=d) for d in AUGMENTED_PATH.split(os.pathsep))
+            self._bins["httpx"] = next((c for c in candidates if c and c != rejected and _validate_httpx(c)), "httpx")
+
+        missing = [tool for tool, path in self._bins.items() if path == tool]
         if missing:
             console.print(Panel(f"[red]Missing tools:[/red] {', '.join(missing)}\nPlease install them via 'go install ...'", title="Missing Dependencies"))
             sys.exit(1)
         self.log("All tools found.", style="green")
 
-    def run_command(self, command: List[str], step_name: str, output_file: Optional[str] = None, append_output: bool = False):
-        """Executes a shell command."""
-        cmd_str = " ".join(command)
+    def run_command(self, command: List[str], step_name: str, output_file: Optional[str] = None):
+        """
+        Executes a shell command. If the tool writes its own results via -o, stdout is discarded;
+        otherwise stdout is streamed straight into output_file.
+        """
         if self.dry_run:
+            cmd_str = " ".join(command)
             console.print(Panel(f"[yellow]DRY RUN:[/yellow] {cmd_str}", title=step_name))
             return True
 
         self.log(f"Running {step_name}...", style="bold magenta")
         try:
-            with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), transient=True) as progress:
-                progress.add_task(description=f"Executing {step_name}...", total=None)
-                
-                # Use subprocess.run
-                result = subprocess.run(command, capture_output=True, text=True, check=False)
+            with console.status(f"[bold magenta]Executing {step_name}...", spinner="dots", refresh_per_second=2):
+                # Only stderr is captured for diagnostics; results never pass through Python
+                tool_writes_own = "-o" in command
+                if tool_writes_own or not output_file:
+                    result = subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=False, env=TOOL_ENV)
+                else:
+                    with open(output_file, 'wb') as out:
+                        result = subprocess.run(command, stdout=out, stderr=subprocess.PIPE, text=True, check=False, env=TOOL_ENV)
 
                 if result.returncode != 0:
-                    if "httpx" in command[0] and "No such option" in result.stderr:
-                         console.print(Panel(f"[bold red]CRITICAL ERROR: Wrong HTTPX Version[/bold red]\nUse the Go version.", title="Version Conflict"))
-                    else:
-                        console.print(f"[red]Error running {step_name}:[/red]\n{result.stderr}")
+                    self.report_failure(command, step_name, result.stderr)
                     return False
-                
-                # Write output
-                if output_file:
-                    mode = 'a' if append_output else 'w'
-                    content = result.stdout.strip()
-                    with open(output_file, mode) as f:
-                        if content: f.write(content + '\n')
-                    # Touch file if empty
-                    if not os.path.exists(output_file):
-                         with open(output_file, 'w') as f: pass
-
-                # Count lines
+
+                # Touch file if the tool produced no results
+                if output_file and not os.path.exists(output_file):
+                    with open(output_file, 'w') as f: pass
+
+                # Count lines (streamed, never materializes the file)
                 line_count = 0
-                if output_file and os.path.exists(output_file):
-                    with open(output_file, 'r') as f:
-                        line_count = len([line for line in f if line.strip()])
+                if output_file:
+                    with open(output_file, 'rb', buffering=1 << 23) as f:
+                        line_count = sum(1 for line in f if line.strip())
                 
                 self.log(f"{step_name} completed. Found {line_count} unique results.", style="green")
                 return True
@@ -126,44 +213,291 @@ class ReconPipeline:
             console.print(f"[red]Exception during {step_name}: {e}[/red]")
             return False
 
+    def report_failure(self, command: List[str], step_name: str, stderr: str):
+        """Prints a tool failure, flagging the Python httpx name clash explicitly."""
+        if os.path.basename(command[0]) == "httpx" and "No such option" in stderr:
+             console.print(Panel(f"[bold red]CRITICAL ERROR: Wrong HTTPX Version[/bold red]\nUse the Go version.", title="Version Conflict"))
+        else:
+            console.print(f"[red]Error running {step_name}:[/red]\n{stderr}")
+
+    def _tee_stage(self, src, output_file, sink, results, index, ensure_line=None):
+        """
+        Copies a stage's stdout into its checkpoint file and the next stage's stdin.
+        If ensure_line is given and never seen, it is appended to both at the end.
+        Stores the line count, or the exception that stopped the copy, in results[index].
+        """
+        found = ensure_line is None
+        count = 0
+        pipe = sink  # sink is dropped on BrokenPipeError; the fd itself must still be closed
+        try:
+            with open(output_file, 'wb') as out:
+                for line in src:
+                    if not line.endswith(b"\n"): line += b"\n"
+                    out.write(line)
+                    entry = line.strip()
+                    if entry:
+                        count += 1
+                        if not found and entry == ensure_line: found = True
+                    if sink:
+                        try:
+                            sink.write(line)
+                        except BrokenPipeError:
+                            sink = None  # Downstream exited; keep draining so upstream never blocks
+                if not found:
+                    out.write(ensure_line + b"\n")
+                    count += 1
+                    if sink:
+                        try:
+                            sink.write(ensure_line + b"\n")
+                        except BrokenPipeError:
+                            sink = None
+            results[index] = count
+        except Exception as e:
+            results[index] = e
+        finally:
+            # Always close both ends, otherwise the neighbouring tools wait on the pipe forever
+            if pipe:
+                try:
+                    pipe.close()
+                except OSError:
+                    pass
+            src.close()
+
+    def run_pipeline(self, stages, ensure_line: Optional[str] = None):
+        """
+        Chains tools through stdin/stdout pipes instead of re-reading files between them.
+        stages is a list of (command, step_name, output_file). Intermediate stages are teed
+        to their output file by a background thread; the last stage writes its own -o file.
+        ensure_line is guaranteed to appear in the first stage's output (e.g. the root domain).
+        """
+        title = " -> ".join(step_name for _, step_name, _ in stages)
+        if self.dry_run:
+            cmd_str = "\n  | ".join(" ".join(command) for command, _, _ in stages)
+            console.print(Panel(f"[yellow]DRY RUN:[/yellow] {cmd_str}", title=title))
+            return True
+
+        self.log(f"Running {title}...", style="bold magenta")
+        procs, errs, threads = [], [], []
+        counts = [0] * len(stages)
+        try:
+            with console.status(f"[bold magenta]Executing {title}...", spinner="dots", refresh_per_second=2):
+                for i, (command, step_name, output_file) in enumerate(stages):
+                    last = i == len(stages) - 1
+                    # Stderr goes to a temp file so a chatty tool can't fill the pipe and stall
+                    err = tempfile.TemporaryFile()
+                    errs.append(err)
+                    proc = subprocess.Popen(command,
+                                            stdin=subprocess.PIPE if i else subprocess.DEVNULL,
+                                            stdout=subprocess.DEVNULL if last else subprocess.PIPE,
+                                            stderr=err,
+                                            env=TOOL_ENV)
+                    if i:
+                        prev_output = stages[i - 1][2]
+                        thread = threading.Thread(target=self._tee_stage, daemon=True,
+                                                  args=(procs[-1].stdout, prev_output, proc.stdin, counts, i - 1,
+                                                        ensure_line.encode() if ensure_line and i == 1 else None))
+                        thread.start()
+                        threads.append(thread)
+                    procs.append(proc)
+
+                for thread in threads: thread.join()
+                tee_failed = any(isinstance(result, Exception) for result in counts[:-1])
+                for proc in procs:
+                    if tee_failed and proc.poll() is None: proc.kill()
+                    proc.wait()
+
+            for (command, step_name, output_file), result in zip(stages[:-1], counts):
+                if isinstance(result, Exception):
+                    console.print(f"[red]Error writing {step_name} output to {output_file}:[/red]\n{result}")
+                    return False
+
+            for (command, step_name, output_file), proc, err in zip(stages, procs, errs):
+                if proc.returncode != 0:
+                    err.seek(0)
+                    self.report_failure(command, step_name, err.read().decode(errors="replace"))
+                    return False
+
+            # Touch file if the last tool produced no results
+            last_output = stages[-1][2]
+            if not os.path.exists(last_output):
+                with open(last_output, 'w') as f: pass
+            with open(last_output, 'rb', buffering=1 << 23) as f:
+                counts[-1] = sum(1 for line in f if line.strip())
+
+            for (_, step_name, _), count in zip(stages, counts):
+                self.log(f"{step_name} completed. Found {count} unique results.", style="green")
+            return True
+        except Exception as e:
+            for proc in procs:
+                if proc.poll() is None: proc.kill()
+            console.print(f"[red]Exception during {title}: {e}[/red]")
+            return False
+        finally:
+            for err in errs: err.close()
+
+    def _read_domains(self, path):
+        """Reads the non-blank domains from a list file."""
+        with open(path, 'r') as f:
+            return [line.strip() for line in f if line.strip()]
+
+    def _shard_paths(self, index):
+        """Returns the (input, subfinder, dnsx) file paths used by shard index."""
+        return tuple(os.path.join(self.output_dir, f"{name}.{index}.txt") for name in ("shard", "subfinder", "dnsx"))
+
+    def _shard_list(self, domains, n):
+        """Round-robins a domain list into n shard files, skipping empty shards."""
+        shard_paths = []
+        for i in range(min(n, len(domains))):
+            shard_path = self._shard_paths(i)[0]
+            with open(shard_path, 'w') as f:
+                f.write("\n".join(domains[i::n]) + "\n")
+            shard_paths.append(shard_path)
+        return shard_paths
+
+    def _shard_steps(self, index, bin_subfinder, bin_dnsx):
+        """Builds the subfinder + dnsx (command, output_file) steps for shard index."""
+        shard_path, sub_out, dns_out = self._shard_paths(index)
+        return [
+            ([bin_subfinder, "-all", "-dL", shard_path, "-o", sub_out], sub_out),
+            ([bin_dnsx, "-l", sub_out, "-o", dns_out], dns_out),
+        ]
+
+    def _run_shard(self, index, bin_subfinder, bin_dnsx):
+        """Runs subfinder + dnsx on a single shard. Raises RuntimeError on tool failure."""
+        steps = self._shard_steps(index, bin_subfinder, bin_dnsx)
+        for command, output_file in steps:
+            result = subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=False, env=TOOL_ENV)
+            if result.returncode != 0:
+                raise RuntimeError(result.stderr)
+            if not os.path.exists(output_file):
+                with open(output_file, 'w') as f: pass
+        return steps[0][1], steps[1][1]
+
+    def _merge_files(self, paths, dest):
+        """Merges line-based files into dest, dropping duplicates. Returns the unique count."""
+        seen = set()
+        with open(dest, 'w') as out:
+            for path in paths:
+                with open(path, 'r') as f:
+                    for line in f:
+                        entry = line.strip()
+                        if entry and entry not in seen:
+                            seen.add(entry)
+                            out.write(entry + "\n")
+        return len(seen)
+
+    def run_sharded_discovery(self, bin_subfinder, bin_dnsx, subfinder_out, dnsx_out):
+        """
+        Splits the domain list into shards and runs subfinder + dnsx on each in parallel,
+        then merges the per-shard results into the canonical subfinder/dnsx files.
+        """
+        n = min(MAX_SHARDS, os.cpu_count() or 1)
+        shard_count = 0
+        sub_outs, dns_outs = [], []
+        failed = False
+        try:
+            domains = self._read_domains(self.domain_list)
+            shard_count = min(n, len(domains))
+
+            if self.dry_run:
+                for i in range(shard_count):
+                    cmd_str = "\n".join(" ".join(command) for command, _ in self._shard_steps(i, bin_subfinder, bin_dnsx))
+                    console.print(Panel(f"[yellow]DRY RUN:[/yellow] {cmd_str}", title=f"Shard {i}: Subfinder + DNSx"))
+                console.print(Panel(f"[yellow]DRY RUN:[/yellow] merge shard results into {subfinder_out} and {dnsx_out}", title="Merge Shards"))
+                return True
+
+            self.log(f"Running Subfinder + DNSx across {shard_count} shards...", style="bold magenta")
+            self._shard_list(domains, n)
+            with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), transient=True, refresh_per_second=2) as progress, \
+                    ThreadPoolExecutor(max_workers=max(1, shard_count)) as executor:
+                futures = {}
+                for i in range(shard_count):
+                    task_id = progress.add_task(description=f"Shard {i}: Subfinder + DNSx...", total=1)
+                    future = executor.submit(self._run_shard, i, bin_subfinder, bin_dnsx)
+                    futures[future] = (i, task_id)
+
+                for future in as_completed(futures):
+                    i, task_id = futures[future]
+                    try:
+                        sub_out, dns_out = future.result()
+                        sub_outs.append(sub_out)
+                        dns_outs.append(dns_out)
+                        progress.update(task_id, completed=1, description=f"Shard {i}: done")
+                    except Exception as e:
+                        console.print(f"[red]Error running shard {i}:[/red]\n{e}")
+                        progress.update(task_id, completed=1, description=f"Shard {i}: failed")
+                        failed = True
+
+            if failed:
+                return False
+
+            # Sort by shard index so merged output is deterministic
+            sub_count = self._merge_files(sorted(sub_outs), subfinder_out)
+            dns_count = self._merge_files(sorted(dns_outs), dnsx_out)
+        except Exception as e:
+            console.print(f"[red]Exception during Subfinder + DNSx: {e}[/red]")
+            return False
+        finally:
+            # Never leave per-shard files behind, even on an exception or Ctrl-C
+            if not self.dry_run:
+                for i in range(shard_count):
+                    for path in self._shard_paths(i):
+                        if os.path.exists(path): os.remove(path)
+
+        self.log(f"Subfinder completed. Found {sub_count} unique results.", style="green")
+        self.log(f"DNSx completed. Found {dns_count} unique results.", style="green")
+        return True
+
     def create_burp_file(self):
         """
         Generates a specific file for Burp Suite import.
-        Combines HTTPx (cleaned) and Katana results into a pure URL list.
+        Combines HTTPx (cleaned Katana input) and Katana results into a pure URL list.
         """
         if self.dry_run: return
 
         self.log("Generating Burp Suite import file...", style="cyan")
         
-        httpx_file = os.path.join(self.output_dir, "httpx.txt")
-        katana_file = os.path.join(self.output_dir, "katana.txt")
-        burp_file = os.path.join(self.output_dir, "urls_for_burp.txt")
-        
-        unique_urls = set()
-
-        # 1. Process HTTPx (needs cleaning: "https://x.com [200]" -> "https://x.com")
-        if os.path.exists(httpx_file):
-            with open(httpx_file, 'r') as f:
-                for line in f:
-                    # Split by space, take first part
-                    clean_url = line.split(' ')[0].strip()
-                    if clean_url.startswith("http"):
-                        unique_urls.add(clean_url)
-
-        # 2. Process Katana (Already pure URLs)
-        if os.path.exists(katana_file):
-            with open(katana_file, 'r') as f:
-                for line in f:
-                    url = line.strip()
-                    if url.startswith("http"):
-                        unique_urls.add(url)
-        
-        # 3. Write to file
-        with open(burp_file, 'w') as f:
-            for url in sorted(unique_urls):
-                f.write(url + "\n")
-        
-        return burp_file, len(unique_urls)
+        httpx_urls_file = self.paths["katana_input"]
+        katana_file = self.paths["endpoints"]
+        burp_file = self.paths["burp_import"]
+        raw_file = burp_file.with_name(burp_file.name + ".raw")
+
+        try:
+            with open(raw_file, 'wb') as raw:
+                # 1. HTTPx URLs (already cleaned for Katana input, reused as-is)
+                if httpx_urls_file.exists():
+                    _append_file(httpx_urls_file, raw)
+
+                # 2. Katana URLs, copied straight through; blank/CRLF/non-http lines are filtered in step 3
+                if katana_file.exists():
+                    _append_file(katana_file, raw)
+
+            # 3. Normalise + dedup + sort: awk | sort -u (C locale => plain byte order, same as Python's sorted)
+            env = {**TOOL_ENV, "LC_ALL": "C"}
+            sort_cmd = ["sort", "-u", f"--parallel={os.cpu_count() or 1}", "-S", "256M", "-o", burp_file, "-"]
+            try:
+                awk = subprocess.Popen(["awk", BURP_URL_AWK, raw_file], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, env=env)
+                try:
+                    sort_rc = subprocess.run(sort_cmd, stdin=awk.stdout, stderr=subprocess.DEVNULL, env=env).returncode
+                finally:
+                    awk.stdout.close()
+                    awk_rc = awk.wait()
+                if sort_rc or awk_rc:
+                    raise subprocess.CalledProcessError(sort_rc or awk_rc, sort_cmd if sort_rc else "awk")
+            except (OSError, subprocess.CalledProcessError):
+                # Fallback without awk/GNU sort (missing, or BusyBox/BSD rejecting the flags): same result in Python
+                with open(raw_file, 'rb') as f:
+                    unique_urls = {url for url in map(_burp_url, f) if url}
+                with open(burp_file, 'wb') as f:
+                    for url in sorted(unique_urls):
+                        f.write(url + b"\n")
+        finally:
+            if raw_file.exists(): os.remove(raw_file)
+
+        # Same counter as generate_summary, so the Done panel matches summary.json
+        url_count = _count_lines(burp_file)
+
+        return burp_file, url_count
 
     def generate_summary(self):
         if self.dry_run: return
@@ -172,83 +506,88 @@ class ReconPipeline:
             "timestamp": datetime.now().isoformat(),
             "stats": {}
         }
-        files = {"subdomains": "subfinder.txt", "resolved": "dnsx.txt", "ports": "naabu.txt", "http_services": "httpx.txt", "endpoints": "katana.txt", "burp_import": "urls_for_burp.txt"}
+        # One directory read instead of a stat() per output file
+        entries = {e.name: e.stat().st_size for e in os.scandir(self.output_dir)}
         
-        for key, filename in files.items():
-            filepath = os.path.join(self.output_dir, filename)
-            if os.path.exists(filepath):
-                with open(filepath, 'r') as f: summary["stats"][key] = len(f.readlines())
+        for key in SUMMARY_STATS:
+            filepath = self.paths[key]
+            if entries.get(filepath.name):
+                summary["stats"][key] = _count_lines(filepath)
             else: summary["stats"][key] = 0
 
-        with open(os.path.join(self.output_dir, "summary.json"), 'w') as f:
-            json.dump(summary, f, indent=4)
-        self.log(f"Summary saved to {os.path.join(self.output_dir, 'summary.json')}", style="bold green")
+        summary_path = self.paths["summary"]
+        with open(summary_path, 'wb') as f:
+            f.write(_json_bytes(summary))
+        self.log(f"Summary saved to {summary_path}", style="bold green")
 
     def run_llm_advisory(self):
         if self.dry_run: return
-        katana_file = os.path.join(self.output_dir, "katana.txt")
-        if not os.path.exists(katana_file): return
+        katana_file = self.paths["endpoints"]
+        if not katana_file.exists(): return
 
         self.log("Generating LLM Advisory Prompt...", style="cyan")
-        with open(katana_file, 'r') as f: urls = [line.strip() for line in f.readlines() if line.strip()]
+        # Stop reading once enough URLs are collected, regardless of katana.txt size
+        with open(katana_file, 'r') as f:
+            urls = list(islice((line.strip() for line in f if line.strip()), LLM_URL_LIMIT))
         if not urls: return
 
-        prompt_content = f"Analyze these URLs and find high-risk endpoints:\n{json.dumps(urls[:200], indent=2)}"
-        prompt_path = os.path.join(self.output_dir, "llm_prompt.txt")
-        with open(prompt_path, 'w') as f: f.write(prompt_content)
+        prompt_content = b"Analyze these URLs and find high-risk endpoints:\n" + _json_bytes(urls)
+        prompt_path = self.paths["llm_prompt"]
+        with open(prompt_path, 'wb') as f: f.write(prompt_content)
         console.print(Panel(f"LLM Prompt generated at: [bold]{prompt_path}[/bold]", title="LLM Integration (Bonus)"))
 
     def execute(self):
         self.check_tools()
         console.print(Panel.fit(f"Target: {self.domain or self.domain_list}\nOutput: {self.output_dir}\nProxy: {self.proxy or 'None'}", title="Starting Recon Chain"))
 
-        bin_subfinder = self.get_binary_path("subfinder")
-        bin_dnsx = self.get_binary_path("dnsx")
-        bin_naabu = self.get_binary_path("naabu")
-        bin_httpx = self.get_binary_path("httpx")
-        bin_katana = self.get_binary_path("katana")
-
-        # 1. Subfinder
-        subfinder_out = os.path.join(self.output_dir, "subfinder.txt")
-        cmd_sub = [bin_subfinder, "-all", "-o", subfinder_out]
-        if self.domain: cmd_sub.extend(["-d", self.domain])
-        elif self.domain_list: cmd_sub.extend(["-dL", self.domain_list])
-        if not self.run_command(cmd_sub, "Subfinder", subfinder_out): return
-
-        # Robustness: Ensure root domain is included
-        if self.domain and not self.dry_run and os.path.exists(subfinder_out):
-            with open(subfinder_out, 'a+') as f:
-                f.seek(0); content = f.read()
-                if self.domain not in content: f.write(f"\n{self.domain}\n")
-
-        # 2. DNSx
-        dnsx_out = os.path.join(self.output_dir, "dnsx.txt")
-        if not self.run_command([bin_dnsx, "-l", subfinder_out, "-o", dnsx_out], "DNSx", dnsx_out): return
-
-        # 3. Naabu
-        naabu_out = os.path.join(self.output_dir, "naabu.txt")
-        if not self.run_command([bin_naabu, "-l", dnsx_out, "-p", DEFAULT_PORTS, "-o", naabu_out], "Naabu", naabu_out): return
-
-        # 4. HTTPx (With Proxy Support)
-        httpx_out = os.path.join(self.output_dir, "httpx.txt")
-        cmd_httpx = [bin_httpx, "-l", naabu_out, "-title", "-tech-detect", "-status-code", "-o", httpx_out]
+        bin_subfinder = self._bins["subfinder"]
+        bin_dnsx = self._bins["dnsx"]
+        bin_naabu = self._bins["naabu"]
+        bin_httpx = self._bins["httpx"]
+        bin_katana = self._bins["katana"]
+
+        subfinder_out = str(self.paths["subdomains"])
+        dnsx_out = str(self.paths["resolved"])
+
+        naabu_out = str(self.paths["ports"])
+        httpx_out = str(self.paths["http_services"])
+
+        # 3. Naabu / 4. HTTPx (With Proxy Support)
+        cmd_naabu = [bin_naabu, "-p", DEFAULT_PORTS, "-silent"]
+        cmd_httpx = [bin_httpx, "-title", "-tech-detect", "-status-code", "-silent", "-o", httpx_out]
         if self.proxy:
             cmd_httpx.extend(["-http-proxy", self.proxy]) # <--- BURP PROXY INTEGRATION
-        if not self.run_command(cmd_httpx, "HTTPx", httpx_out): return
+
+        if self.domain:
+            # 1-4. Subfinder | DNSx | Naabu | HTTPx, piped end to end; each stage is still saved to disk.
+            # Robustness: the root domain is always fed to DNSx and kept in subfinder.txt
+            stages = [
+                ([bin_subfinder, "-all", "-silent", "-d", self.domain], "Subfinder", subfinder_out),
+                ([bin_dnsx, "-silent"], "DNSx", dnsx_out),
+                (cmd_naabu, "Naabu", naabu_out),
+                (cmd_httpx, "HTTPx", httpx_out),
+            ]
+            if not self.run_pipeline(stages, ensure_line=self.domain): return
+        else:
+            # 1+2. Subfinder + DNSx, fanned out per shard of the domain list
+            if not self.run_sharded_discovery(bin_subfinder, bin_dnsx, subfinder_out, dnsx_out): return
+
+            # 3+4. Naabu | HTTPx, reading the merged DNSx results
+            stages = [
+                (cmd_naabu + ["-l", dnsx_out], "Naabu", naabu_out),
+                (cmd_httpx, "HTTPx", httpx_out),
+            ]
+            if not self.run_pipeline(stages): return
 
         # --- KATANA PREP: CLEAN HTTPX OUTPUT ---
-        katana_input = os.path.join(self.output_dir, "katana_input_clean.txt")
+        katana_input = str(self.paths["katana_input"])
         if not self.dry_run and os.path.exists(httpx_out):
-            with open(httpx_out, 'r') as infile, open(katana_input, 'w') as outfile:
-                for line in infile:
-                    clean_url = line.split(' ')[0] # Strip titles/status codes
-                    if clean_url.strip():
-                        outfile.write(clean_url.strip() + "\n")
+            _extract_first_field(httpx_out, katana_input) # Strip titles/status codes
         else:
             katana_input = httpx_out 
 
         # 5. Katana (With Proxy Support)
-        katana_out = os.path.join(self.output_dir, "katana.txt")
+        katana_out = str(self.paths["endpoints"])
         cmd_katana = [bin_katana, "-list", katana_input, "-o", katana_out, "-jc", "-kf", "all", "-c", "10", "-d", "2"]
         if self.proxy:
             cmd_katana.extend(["-proxy", self.proxy]) # <--- BURP PROXY INTEGRATION
@@ -258,8 +597,11 @@ class ReconPipeline:
         burp_file_path, burp_count = self.create_burp_file() if not self.dry_run else (None, 0)
 
         # 7. Finalize
-        self.generate_summary()
-        if self.llm_analysis: self.run_llm_advisory()
+        # Summary and LLM prompt are independent I/O-bound steps, run them side by side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(self.generate_summary)]
+            if self.llm_analysis: futures.append(executor.submit(self.run_llm_advisory))
+        for future in futures: future.result()
         
         # Final Output Panel
         success_msg = f"[bold green]Recon Chain Complete![/bold green]\n"